@@ -1,19 +1,27 @@
 
 from io import BytesIO
-import hashlib
 import shutil
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import multiprocessing
 import errno
+import mmap
+import os
 import shlex
 from pathlib import Path
 import subprocess
-import sys
+import blake3
 import click
 import magic
 import pdf2image
+import tesserocr
 import docker
 from docker import DockerClient
 
+# first line of the fingerprint file, bump when the fingerprint changes
+FINGERPRINT_HEADER = '# docspace fingerprints v2 blake3'
+
 class Config:
     def __init__(self):
 
@@ -24,29 +32,73 @@ class Config:
         self.data_dir = Path.joinpath(Path.home(), 'docspace')
         self.text_dir = Path.joinpath(self.data_dir, '_text')
         self.text_suffix = '.txt'
-        self.md5sum_file = Path.joinpath(self.text_dir, '.md5sums.txt')
+        self.fingerprint_file = Path.joinpath(self.text_dir, '.fingerprints.txt')
+        # md5 based, written by older versions
+        self.legacy_md5sum_file = Path.joinpath(self.text_dir, '.md5sums.txt')
+
+        # ocr results by content fingerprint, survives rescan_all
+        self.ocr_cache_dir = Path.joinpath(Path.home(), '.cache', 'docspace', 'ocr')
 
         self.tesseract_languages = ['deu']
+        # pdf pages are rendered at this dpi too
+        self.tesseract_dpi = 300
 
-        self.tesseract_template = 'docker run --rm \
-            -v "{INPUT_FILE_PATH}":"/tmp/input/{INPUT_FILE}" \
-            {TESSERACT_IMAGE} --dpi 600 -l {LANGUAGES} "/tmp/input/{INPUT_FILE}" stdout'
+        # ocr runs in-process via tesserocr unless this is set
+        self.use_docker = False
+        self.dockermanager = None
     
     def setup(self):
         if not self.data_dir.exists():
             self.data_dir.mkdir(parents=True, exist_ok=True)
         if not self.text_dir.exists():
             self.text_dir.mkdir(parents=True, exist_ok=True)
-        if not self.md5sum_file.exists():
-            self.md5sum_file.touch(exist_ok=True)
+        if not self.ocr_cache_dir.exists():
+            self.ocr_cache_dir.mkdir(parents=True, exist_ok=True)
+        # {path: fingerprint} of library files, if setup had to hash them
+        self.library_fingerprints = {}
+        self.seen_fingerprints = self.load_fingerprints()
+
+    def load_fingerprints(self):
+        if self.fingerprint_file.exists():
+            header, _, fingerprints = self.fingerprint_file.read_text().partition('\n')
+            if header == FINGERPRINT_HEADER:
+                return set(fingerprints.split())
+        # missing or from another fingerprint version,
+        # rebuild it from the documents we already have
+        file_paths = get_library_files(self)
+        if file_paths:
+            click.echo(f'fingerprinting {len(file_paths)} existing documents...')
+        self.library_fingerprints = {
+            file_path: get_fingerprint(file_path) for file_path in file_paths}
+        fingerprints = set(self.library_fingerprints.values())
+        self.fingerprint_file.write_text(
+            '\n'.join([FINGERPRINT_HEADER, *fingerprints]) + '\n')
+        if self.legacy_md5sum_file.exists():
+            self.legacy_md5sum_file.unlink()
+        return fingerprints
+
+_docker_client = None
+
+def get_docker_client() -> DockerClient:
+    # connecting to the daemon is not free, so share one client per process
+    global _docker_client
+    if _docker_client is None:
+        _docker_client = docker.from_env()
+    return _docker_client
 
 class DockerManager:
+    # tags we have seen built, shared by all instances
+    built_tags = set()
+
     def __init__(self, config: Config):
         self.config = config
-        self.client: DockerClient = docker.from_env()
+        self.client: DockerClient = get_docker_client()
 
         self.languages = config.tesseract_languages
 
+        self.container = None
+        self.workdir = None
+
     def build_if_neccessary(self):
         if not self.is_image_built():
             click.echo(f'building tesseract image for {self.languages}...')
@@ -58,15 +110,20 @@ class DockerManager:
         return tag
 
     def is_image_built(self):
+        # only ask the daemon until we have seen the image once
         tag = self.get_tag()
-        images = self.client.images.list(tag)
-        return bool(images)
+        if tag not in self.built_tags:
+            images = self.client.images.list(tag)
+            if images:
+                self.built_tags.add(tag)
+        return tag in self.built_tags
 
     def build_image(self):
         dockerfile = self.get_dockerfile()
         tag = self.get_tag()
         click.echo(f'building {tag}')
         image = self.client.images.build(fileobj=dockerfile, tag=tag)
+        self.built_tags.add(tag)
         return image
 
     def get_dockerfile(self):
@@ -80,23 +137,98 @@ class DockerManager:
             output.write(f'RUN train-lang {language} --fast\n'.encode())
         return output
 
+    def start_worker(self):
+        # one long-lived container per cli run, every page is just an exec
+        self.workdir = Path(tempfile.mkdtemp(prefix='docspace_'))
+        self.workdir.chmod(0o755)
+        self.container = self.client.containers.run(
+            self.get_tag(),
+            entrypoint=['sleep', 'infinity'],
+            detach=True,
+            volumes={str(self.workdir): {'bind': '/tmp/input', 'mode': 'ro'}})
+
+    def stop_worker(self):
+        if self.container is not None:
+            self.container.remove(force=True)
+            self.container = None
+        if self.workdir is not None:
+            shutil.rmtree(self.workdir, ignore_errors=True)
+            self.workdir = None
+
+    def run_tesseract(self, input_file_path):
+        if self.container is None:
+            self.start_worker()
+        fd, input_path = tempfile.mkstemp(
+            dir=self.workdir, suffix=Path(input_file_path).suffix)
+        os.close(fd)
+        input_path = Path(input_path)
+        try:
+            shutil.copy(input_file_path, input_path)
+            input_path.chmod(0o644)
+            tesseract_command = [
+                'tesseract', '--dpi', str(self.config.tesseract_dpi),
+                '-l', '+'.join(self.languages),
+                f'/tmp/input/{input_path.name}', 'stdout']
+            print(tesseract_command)
+            exit_code, (stdout, stderr) = self.container.exec_run(
+                tesseract_command, demux=True)
+        finally:
+            input_path.unlink()
+        if exit_code != 0:
+            raise subprocess.CalledProcessError(
+                exit_code, tesseract_command, stdout, stderr)
+        # decode once, a stray invalid byte shouldn't lose the whole page
+        return (stdout or b'').decode('utf-8', errors='replace')
+
 
 
 
 @click.group()
 #@click.option('-c', 'config', type=click.Path(exists=True, file_okay=True))
+@click.option('--use-docker', is_flag=True, help='run tesseract in docker instead of in-process')
 @click.pass_context
-def cli(ctx):
+def cli(ctx, use_docker):
     config = Config()
+    config.use_docker = use_docker
     config.setup()
     ctx.obj = config
-
-
-def get_md5sum(file_path: Path):
-    with file_path.open(mode="rb") as f:
-        file_hash = hashlib.md5()
-        while chunk := f.read(8192):
-            file_hash.update(chunk)
+    ctx.call_on_close(lambda: stop_dockermanager(config))
+
+
+def get_dockermanager(config: Config):
+    if config.dockermanager is None:
+        dockermanager = DockerManager(config)
+        dockermanager.build_if_neccessary()
+        dockermanager.start_worker()
+        config.dockermanager = dockermanager
+    return config.dockermanager
+
+
+def stop_dockermanager(config: Config):
+    if config.dockermanager is not None:
+        config.dockermanager.stop_worker()
+        config.dockermanager = None
+
+
+FINGERPRINT_CHUNK_SIZE = 1 << 20
+FINGERPRINT_MMAP_THRESHOLD = 8 << 20
+
+def get_fingerprint(file_path: Path):
+    # blake3 is simd accelerated and a lot faster than md5 on large files
+    file_hash = blake3.blake3()
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    with os.fdopen(fd, 'rb') as f:
+        # we read the file front to back once, let the kernel read ahead
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        if os.fstat(fd).st_size > FINGERPRINT_MMAP_THRESHOLD:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                file_hash.update(mm)
+        else:
+            while chunk := f.read(FINGERPRINT_CHUNK_SIZE):
+                file_hash.update(chunk)
     return file_hash.hexdigest()
 
 @cli.command('import')
@@ -106,73 +238,182 @@ def _import(config: Config, file_paths):
     import_files(config, file_paths)
 
 def is_not_imported(config, file_path):
-    with config.md5sum_file.open() as f:
-        sums = []
-        for s in f.readlines():
-            sums.append(s.strip())
-    new_file_sum = get_md5sum(file_path)
-    if new_file_sum in sums:
-        return False
-    return True
-
-def add_md5sum(config, file_path):
-    new_file_sum = get_md5sum(file_path)
-    with config.md5sum_file.open('a') as f:
-        f.write(new_file_sum + '\n')
-
-def get_content(config: Config, file_path):
-    mime_type = magic.from_file(str(file_path), mime=True)
+    fingerprint = get_fingerprint(file_path)
+    return fingerprint not in config.seen_fingerprints, fingerprint
+
+def add_fingerprints(config, fingerprints):
+    if not fingerprints:
+        return
+    with config.fingerprint_file.open('a') as f:
+        f.write('\n'.join(fingerprints) + '\n')
+        f.flush()
+        os.fsync(f.fileno())
+    config.seen_fingerprints.update(fingerprints)
+
+# extensions we trust without asking libmagic
+MIME_TYPES_BY_SUFFIX = {
+    '.txt': 'text/plain',
+    '.pdf': 'application/pdf',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+}
+MAGIC_BUFFER_SIZE = 4096
+
+def get_mime_type(file_path):
+    mime_type = MIME_TYPES_BY_SUFFIX.get(Path(file_path).suffix.lower())
+    if mime_type is None:
+        # the file header is enough for libmagic
+        with Path(file_path).open(mode='rb') as f:
+            mime_type = magic.from_buffer(f.read(MAGIC_BUFFER_SIZE), mime=True)
+    return mime_type
+
+def get_content(config: Config, file_path, fingerprint=None):
+    mime_type = get_mime_type(file_path)
 
     content = ''
     if mime_type == 'text/plain':
         print('just copy to _text')
         content = get_txt_content(file_path)
 
-    elif mime_type == 'application/pdf':
-        print('run tesseract, result to _text')
-        content = process_pdf(config, file_path)
-
-    elif mime_type == 'image/png':
-        print('run tesseract, result to _text')
-        content = run_tesseract(config, file_path)
-    elif mime_type == 'image/jpeg':
-        print('run tesseract, result to _text')
-        content = run_tesseract(config, file_path)
+    elif mime_type in ('application/pdf', 'image/png', 'image/jpeg'):
+        content = get_ocr_content(config, file_path, mime_type, fingerprint)
 
     else:
         print(f'unknown mime type {mime_type}')
     return content
 
 
+def get_ocr_content(config: Config, file_path, mime_type, fingerprint=None):
+    if fingerprint is None:
+        fingerprint = get_fingerprint(Path(file_path))
+    content = read_ocr_cache(config, fingerprint)
+    if content is not None:
+        print('using cached ocr result')
+        return content
+
+    print('run tesseract, result to _text')
+    if mime_type == 'application/pdf':
+        content = process_pdf(config, file_path)
+    else:
+        content = run_tesseract(config, file_path)
+    write_ocr_cache(config, fingerprint, content)
+    return content
+
+
+def get_ocr_cache_path(config: Config, fingerprint):
+    # languages, dpi and engine all change the result
+    languages = '+'.join(config.tesseract_languages)
+    engine = 'docker' if config.use_docker else 'tesserocr'
+    return Path.joinpath(
+        config.ocr_cache_dir,
+        f'{fingerprint}_{languages}_{config.tesseract_dpi}dpi_{engine}.txt')
+
+
+def read_ocr_cache(config: Config, fingerprint):
+    cache_path = get_ocr_cache_path(config, fingerprint)
+    if cache_path.exists():
+        return cache_path.read_text()
+    return None
+
+
+def write_ocr_cache(config: Config, fingerprint, content):
+    cache_path = get_ocr_cache_path(config, fingerprint)
+    # pool workers may write the same entry, so write and rename
+    tmp_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.tmp')
+    tmp_path.write_text(content)
+    os.replace(tmp_path, cache_path)
+
+
 @cli.command()
 @click.pass_obj
 def rescan_all(config: Config):
     if not click.confirm('this will delete your text cache - continue?', default=False):
         exit(0)
+    # the fingerprint index still matches the library, keep it
+    fingerprint_index = config.fingerprint_file.read_bytes()
     shutil.rmtree(config.text_dir)
-    # recreate folder
-    config.setup()
-
-    pathlist = Path(config.data_dir).glob('**/*')
-    pathlist = set(pathlist) - set(Path(config.text_dir).glob('**/*'))
-    pathlist = pathlist - set([config.text_dir])
-    for file_path in pathlist:
-        if file_path.is_file():
-            click.echo(f'processing {file_path}')
-            content = get_content(config, file_path)
+    # recreate folders, without running setup again - that would throw
+    # away the fingerprints cli's setup may have just computed
+    config.text_dir.mkdir(parents=True, exist_ok=True)
+    config.ocr_cache_dir.mkdir(parents=True, exist_ok=True)
+    config.fingerprint_file.write_bytes(fingerprint_index)
+
+    pathlist = get_library_files(config)
+    # filled in if cli's setup had to rebuild the index, empty otherwise
+    contents = get_contents(config, pathlist, config.library_fingerprints)
+    with contextlib.closing(contents):
+        for file_path, content in contents:
+            click.echo(f'processed {file_path}')
             write_content_for_file(config, file_path, content)
 
 
+def get_library_files(config: Config):
+    # single walk over data_dir, not descending into _text
+    pathlist = []
+    for root, dirs, files in os.walk(config.data_dir):
+        root = Path(root)
+        if root == config.text_dir:
+            dirs[:] = []
+            continue
+        for name in files:
+            file_path = root / name
+            if file_path.is_file():
+                pathlist.append(file_path)
+    return pathlist
+
+
 def import_files(config: Config, file_paths):
+    to_import = []
+    fingerprints = {}
+    batch_fingerprints = set()
     for file_path in file_paths:
         file_path = Path(file_path).absolute()
         if file_path.is_file():
-            if is_not_imported(config, file_path):
-                content = get_content(config, file_path)
-                import_file(config, file_path, content)
+            not_imported, fingerprint = is_not_imported(config, file_path)
+            # also skip duplicates within this batch
+            if not_imported and fingerprint not in batch_fingerprints:
+                batch_fingerprints.add(fingerprint)
+                to_import.append(file_path)
+                fingerprints[file_path] = fingerprint
             else:
                 click.echo(f'{file_path} is already imported, skipping!')
 
+    # written in one go at the end, even if an import fails halfway
+    new_fingerprints = []
+    contents = get_contents(config, to_import, fingerprints)
+    try:
+        # closing shuts the pool down right away if an import fails
+        with contextlib.closing(contents):
+            for file_path, content in contents:
+                import_file(config, file_path, content)
+                new_fingerprints.append(fingerprints[file_path])
+    finally:
+        add_fingerprints(config, new_fingerprints)
+
+
+def get_contents(config: Config, file_paths, fingerprints=None):
+    """
+    yields (file_path, content) in order. get_content runs in a
+    process pool for two or more files with in-process ocr, and
+    inline for a single file or with --use-docker
+    """
+    fingerprints = fingerprints or {}
+    file_fingerprints = [fingerprints.get(file_path) for file_path in file_paths]
+    if config.use_docker or len(file_paths) < 2:
+        # the docker worker lives in this process, and a single file
+        # is better off with process_pdf spreading its pages over a pool
+        for file_path, fingerprint in zip(file_paths, file_fingerprints):
+            yield file_path, get_content(config, file_path, fingerprint)
+        return
+    executor = get_process_pool(config)
+    try:
+        yield from zip(file_paths, executor.map(
+            _get_content_in_worker, file_paths, file_fingerprints))
+    finally:
+        # when we stop early, don't wait for the files not started yet
+        executor.shutdown(wait=True, cancel_futures=True)
+
 
 def import_file(config: Config, file_path: Path, content: str):
     file_name = file_path.name
@@ -189,7 +430,6 @@ def import_file(config: Config, file_path: Path, content: str):
     except shutil.SameFileError as e:
         pass
     write_content_for_file(config, destination, content)
-    add_md5sum(config, file_name)
    
 def write_content_for_file(config, source_file: Path, content):
     text_file = source_file.name + config.text_suffix
@@ -210,63 +450,121 @@ def get_txt_content(file_path):
 
 def process_pdf(config, input_path):
     with tempfile.TemporaryDirectory() as tempdir:
-        image_paths = convert_pdf_to_images(input_path, tempdir)
-        content = ''
-        for path in image_paths:
-            content += run_tesseract(config, path)
-    return content
-
-def convert_pdf_to_images(input_path, tempdir):
-    images = pdf2image.convert_from_path(input_path)
-    paths = []
-    for num, img in enumerate(images): 
-        path = f'{tempdir}/output_{num}.jpg'
-        img.save(path, 'JPEG')
-        paths.append(path)
+        image_paths = convert_pdf_to_images(config, input_path, tempdir)
+        # pages are cached too, so a pdf with one changed page
+        # only needs that page ocr'd again
+        page_fingerprints = [get_fingerprint(Path(path)) for path in image_paths]
+        parts = [read_ocr_cache(config, fingerprint) for fingerprint in page_fingerprints]
+        missing = [num for num, part in enumerate(parts) if part is None]
+        missing_paths = [image_paths[num] for num in missing]
+        if config.use_docker or _worker_config is not None or len(missing_paths) < 2:
+            # the docker worker lives in this process, and inside a file
+            # level pool worker we can't start another pool - so pages go one by one
+            results = [run_tesseract(config, path) for path in missing_paths]
+        else:
+            with get_process_pool(config) as executor:
+                results = list(executor.map(_run_tesseract_in_worker, missing_paths))
+        for num, part in zip(missing, results):
+            write_ocr_cache(config, page_fingerprints[num], part)
+            parts[num] = part
+    return ''.join(parts)
+
+def convert_pdf_to_images(config: Config, input_path, tempdir):
+    # pdftoppm renders pages in parallel and writes them straight to tempdir.
+    # on macos, many threads on a large pdf can hit the open file limit -
+    # raise it with `ulimit -n` if conversion fails
+
+    # inside a pool worker the other workers already use the remaining cores
+    thread_count = 1 if _worker_config is not None else os.cpu_count() or 4
+    paths = pdf2image.convert_from_path(
+        input_path,
+        dpi=config.tesseract_dpi,
+        thread_count=thread_count,
+        output_folder=tempdir,
+        # lossless grayscale - jpeg artifacts only hurt tesseract
+        fmt='png',
+        grayscale=True,
+        paths_only=True)
     return paths
 
-def run_tesseract(config:Config, input_file_path):
-    dockermanager = DockerManager(config)
-    dockermanager.build_if_neccessary()
-    imagename = dockermanager.get_tag()
-
-    input_filename = Path(input_file_path).name
-    tesseract_command = shlex.split(
-            config.tesseract_template.format(
-                INPUT_FILE_PATH=input_file_path, 
-                INPUT_FILE=input_filename,
-                TESSERACT_IMAGE=imagename,
-                LANGUAGES='+'.join(config.tesseract_languages)))
-    print(tesseract_command)
-    output = subprocess.check_output(tesseract_command)
-    return output.decode()
+def get_tesseract_api(config: Config):
+    api = tesserocr.PyTessBaseAPI(lang='+'.join(config.tesseract_languages))
+    api.SetVariable('user_defined_dpi', str(config.tesseract_dpi))
+    return api
+
+def run_tesseract(config:Config, input_file_path, api=None):
+    if config.use_docker:
+        dockermanager = get_dockermanager(config)
+        return dockermanager.run_tesseract(input_file_path)
+    if api is None and _worker_config is not None:
+        api = _get_worker_tesseract_api()
+    if api is None:
+        with get_tesseract_api(config) as api:
+            return run_tesseract(config, input_file_path, api)
+    api.SetImageFile(str(input_file_path))
+    return api.GetUTF8Text()
+
+_worker_config = None
+_worker_tesseract_api = None
+
+def get_process_pool(config: Config):
+    # one worker per core already, so tesseract's openmp threads would only
+    # oversubscribe. libgomp reads this when it is loaded, so workers are
+    # spawned fresh with it set instead of forked from this process.
+    # this sets it for the whole process and every later subprocess,
+    # unless the user already set it themselves
+    os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+    # config is sent once per worker instead of with every task
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_pool_worker,
+        initargs=(config,))
+
+def _init_pool_worker(config: Config):
+    global _worker_config
+    _worker_config = config
+
+def _get_worker_tesseract_api():
+    # every pool process inits tesseract once and reuses it for all its pages
+    global _worker_tesseract_api
+    if _worker_tesseract_api is None:
+        _worker_tesseract_api = get_tesseract_api(_worker_config)
+    return _worker_tesseract_api
+
+def _run_tesseract_in_worker(input_file_path):
+    return run_tesseract(_worker_config, input_file_path)
+
+def _get_content_in_worker(file_path, fingerprint):
+    return get_content(_worker_config, file_path, fingerprint)
 
 
 
 def launch_fzf(config: Config):
-    content = []
-    pathlist = Path(config.text_dir).glob('**/*' + config.text_suffix)
-    for path in pathlist:
-        filename = text_file_path_to_doc_path(config, path)
-        for line in path.open().readlines():
-            if line.strip():
-                content.append(f'{filename}:{line}')
-
-    python_executable = sys.executable
-    script = sys.argv[0]
-    # we have to launch the preview parser as an external program
-    preview_preprocess_command = '%s %s _parse_preview {} {q}' % (
-        python_executable, script)
-    #output = subprocess.check_output(
-    #    ('fzf', '--reverse', '--multi', '--ansi', '--preview', f"{preview_preprocess_command}"), input=''.join(content).encode())
-    preview_command = "rg \
-            --ignore-case --pretty \
-            --context 10 '{q}' '{}'"
-    RG_PREFIX="rg --files-with-matches --column --line-number --no-heading --color=always --smart-case"
-    FZF_DEFAULT_COMMAND="fzf --multi --no-clear --bind 'change:reload:%s {q}' --ansi --phony --query '' --preview '%s'" % (RG_PREFIX, preview_command)
-
-    output = subprocess.check_output(shlex.split(RG_PREFIX) + ['.'], cwd=config.text_dir)
-    output = subprocess.check_output(shlex.split(FZF_DEFAULT_COMMAND), input=output, cwd=config.text_dir)
+    rg_command = [
+        'rg', '--files-with-matches', '--column', '--line-number',
+        '--no-heading', '--color=always', '--smart-case']
+    # fzf runs these through its own shell and fills in {q} and {} quoted
+    reload_command = shlex.join(rg_command) + ' {q}'
+    preview_command = 'rg --ignore-case --pretty --context 10 {q} {}'
+    fzf_command = [
+        'fzf', '--multi', '--no-clear',
+        '--bind', f'change:reload:{reload_command}',
+        '--ansi', '--phony', '--query', '',
+        '--preview', preview_command]
+
+    # stream rg's file list straight into fzf
+    rg = subprocess.Popen(
+        rg_command + ['.'], stdout=subprocess.PIPE, cwd=config.text_dir)
+    fzf = subprocess.Popen(
+        fzf_command, stdin=rg.stdout, stdout=subprocess.PIPE,
+        cwd=config.text_dir)
+    # so rg gets SIGPIPE if fzf exits first
+    rg.stdout.close()
+    output, _ = fzf.communicate()
+    rg.wait()
+    if fzf.returncode != 0:
+        raise subprocess.CalledProcessError(fzf.returncode, fzf.args, output)
     print('')
     print(text_file_path_to_doc_path(config, Path(output.decode())))
 
@@ -296,4 +594,5 @@ def docker_rebuild(config: Config):
     dockermanager.build_image()
 
 
-cli()
+if __name__ == '__main__':
+    cli()
@@ -1,10 +1,12 @@
 from setuptools import setup, find_packages
 
 requirements = [
+    "blake3==0.3.3",
     "click==7.1.2",
     "pdf2image==1.14.0",
     "Pillow==8.0.1",
     "python-magic==0.4.18",
+    "tesserocr==2.5.1",
 ]
 
 test_requirements = [